@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Dict, List, Optional
 
 from capitalone_dataprofiler_expectations.rule_based_profiler.data_assistant_result import (
@@ -30,6 +31,19 @@ from great_expectations.rule_based_profiler.parameter_container import (
 from great_expectations.rule_based_profiler.rule import Rule
 from great_expectations.validator.validator import Validator
 
+DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME: str = sys.intern(
+    f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column"
+)
+PARAMETER_VALUE_KEY_SUFFIX: str = sys.intern(
+    f"{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}"
+)
+PARAMETER_METADATA_KEY_SUFFIX: str = sys.intern(
+    f"{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}"
+)
+VARIABLES_STRICT_MIN: str = sys.intern(f"{VARIABLES_KEY}strict_min")
+VARIABLES_STRICT_MAX: str = sys.intern(f"{VARIABLES_KEY}strict_max")
+VARIABLES_PROFILE_PATH: str = sys.intern(f"{VARIABLES_KEY}profile_path")
+
 
 class DataProfilerStructuredDataAssistant(DataAssistant):
     """
@@ -108,7 +122,7 @@ class DataProfilerStructuredDataAssistant(DataAssistant):
             suffix=None,
             metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
             metric_value_kwargs={
-                "profile_path": f"{VARIABLES_KEY}profile_path",
+                "profile_path": VARIABLES_PROFILE_PATH,
             },
         )
 
@@ -121,55 +135,60 @@ class DataProfilerStructuredDataAssistant(DataAssistant):
                 **data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.to_json_dict(),
             ),
         ]
+
+        profile_report_fully_qualified_parameter_name: str = (
+            data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name
+        )
+
         expect_column_min_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_min_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.min",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.min",
             max_value=None,
-            strict_min=f"{VARIABLES_KEY}strict_min",
+            strict_min=VARIABLES_STRICT_MIN,
             strict_max=None,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_max_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_max_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
             min_value=None,
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.max",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.max",
             strict_min=None,
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_mean_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_mean_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.mean",
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.mean",
-            strict_min=f"{VARIABLES_KEY}strict_min",
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.mean",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.mean",
+            strict_min=VARIABLES_STRICT_MIN,
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_stddev_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_stdev_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.stddev",
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.stddev",
-            strict_min=f"{VARIABLES_KEY}strict_min",
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.stddev",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.stddev",
+            strict_min=VARIABLES_STRICT_MIN,
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
@@ -221,7 +240,7 @@ class DataProfilerStructuredDataAssistant(DataAssistant):
             suffix=None,
             metric_domain_kwargs=DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME,
             metric_value_kwargs={
-                "profile_path": f"{VARIABLES_KEY}profile_path",
+                "profile_path": VARIABLES_PROFILE_PATH,
             },
         )
 
@@ -234,55 +253,60 @@ class DataProfilerStructuredDataAssistant(DataAssistant):
                 **data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.to_json_dict(),
             ),
         ]
+
+        profile_report_fully_qualified_parameter_name: str = (
+            data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name
+        )
+
         expect_column_min_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_min_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.min",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.min",
             max_value=None,
-            strict_min=f"{VARIABLES_KEY}strict_min",
+            strict_min=VARIABLES_STRICT_MIN,
             strict_max=None,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_max_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_max_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
             min_value=None,
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.max",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.max",
             strict_min=None,
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_mean_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_mean_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.mean",
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.mean",
-            strict_min=f"{VARIABLES_KEY}strict_min",
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.mean",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.mean",
+            strict_min=VARIABLES_STRICT_MIN,
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
         expect_column_stddev_to_be_between_expectation_configuration_builder: ExpectationConfigurationBuilder = DefaultExpectationConfigurationBuilder(
             expectation_type="expect_column_stdev_to_be_between",
             validation_parameter_builder_configs=validation_parameter_builder_configs,
-            column=f"{DOMAIN_KWARGS_PARAMETER_FULLY_QUALIFIED_NAME}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}column",
-            min_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.std",
-            max_value=f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_VALUE_KEY}.statistics.precision.std",
-            strict_min=f"{VARIABLES_KEY}strict_min",
-            strict_max=f"{VARIABLES_KEY}strict_max",
+            column=DOMAIN_KWARGS_COLUMN_FULLY_QUALIFIED_NAME,
+            min_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.std",
+            max_value=f"{profile_report_fully_qualified_parameter_name}{PARAMETER_VALUE_KEY_SUFFIX}.statistics.precision.std",
+            strict_min=VARIABLES_STRICT_MIN,
+            strict_max=VARIABLES_STRICT_MAX,
             meta={
-                "profiler_details": f"{data_profiler_profile_report_metric_single_batch_parameter_builder_for_validations.json_serialized_fully_qualified_parameter_name}{FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER}{FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY}",
+                "profiler_details": f"{profile_report_fully_qualified_parameter_name}{PARAMETER_METADATA_KEY_SUFFIX}",
             },
         )
 
@@ -1,6 +1,7 @@
 import copy
 import logging
 import warnings
+from typing import AbstractSet
 
 from great_expectations.data_context.util import (
     instantiate_class_from_config,
@@ -103,7 +104,17 @@ class LegacyDatasource:
     --ge-feature-maturity-info--
     """
 
-    recognized_batch_parameters = {"limit"}
+    __slots__ = (
+        "_data_context",
+        "_name",
+        "_data_asset_type",
+        "_datasource_config",
+        "_batch_kwargs_generators",
+        "_raw_config",
+        "__weakref__",
+    )
+
+    recognized_batch_parameters: AbstractSet[str] = frozenset({"limit"})
 
     @classmethod
     def from_configuration(cls, **kwargs):
@@ -1,6 +1,9 @@
-import datetime
 import logging
+import time
 import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from great_expectations.compatibility import pyspark
 from great_expectations.core.batch import Batch, BatchMarkers
@@ -13,6 +16,68 @@ from great_expectations.types.configurations import classConfigSchema
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_OPTS: Mapping[str, Any] = MappingProxyType({})
+
+_EXT_TO_METHOD = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".parquet": "parquet",
+    ".parq": "parquet",
+    ".pqt": "parquet",
+}
+
+
+def _get_ge_load_time() -> str:
+    """Return the current UTC time formatted as "%Y%m%dT%H%M%S.%fZ", without constructing datetime objects."""
+    seconds, microseconds = divmod(time.time_ns() // 1000, 1_000_000)
+    return (
+        time.strftime("%Y%m%dT%H%M%S", time.gmtime(seconds)) + f".{microseconds:06d}Z"
+    )
+
+
+@lru_cache(maxsize=1024)
+def _reader_method_from_extension(ext: str):
+    return _EXT_TO_METHOD.get(ext)
+
+
+@lru_cache(maxsize=16)
+def _cached_spark_application(
+    spark_config_items: frozenset, force_reuse_spark_context: bool
+):
+    return get_or_create_spark_application(
+        spark_config=dict(spark_config_items),
+        force_reuse_spark_context=force_reuse_spark_context,
+    )
+
+
+def _spark_context_stopped(spark) -> bool:
+    # Stopping a SparkContext from Python (e.g. "spark.stop()") sets its "_jsc" to None.
+    # noinspection PyProtectedMember,PyUnresolvedReferences
+    jsc = spark.sparkContext._jsc
+    return jsc is None or jsc.sc().isStopped()
+
+
+def _get_spark_application(spark_config: dict, force_reuse_spark_context: bool):
+    """Return a SparkSession for the given config, reusing one already obtained for an identical config.
+
+    A cached session whose SparkContext has since been stopped is discarded and re-created.
+    """
+    try:
+        spark_config_items = frozenset(spark_config.items())
+    except TypeError:
+        # Unhashable config values cannot be used as a cache key.
+        return get_or_create_spark_application(
+            spark_config=spark_config,
+            force_reuse_spark_context=force_reuse_spark_context,
+        )
+
+    spark = _cached_spark_application(spark_config_items, force_reuse_spark_context)
+    if _spark_context_stopped(spark):
+        _cached_spark_application.cache_clear()
+        spark = _cached_spark_application(spark_config_items, force_reuse_spark_context)
+
+    return spark
+
 
 class SparkDFDatasource(LegacyDatasource):
     """The SparkDFDatasource produces SparkDFDatasets and supports generators capable of interacting with local
@@ -42,11 +107,28 @@ class SparkDFDatasource(LegacyDatasource):
     --ge-feature-maturity-info--
     """
 
-    recognized_batch_parameters = {
-        "reader_method",
-        "reader_options",
-        "limit",
-        "dataset_options",
+    __slots__ = ("spark",)
+
+    recognized_batch_parameters = frozenset(
+        {
+            "reader_method",
+            "reader_options",
+            "limit",
+            "dataset_options",
+        }
+    )
+
+    # Checked in order; the first batch_kwargs key present determines how the DataFrame is obtained.
+    _BATCH_KWARGS_HANDLERS = (
+        ("path", "_get_data_from_path"),
+        ("query", "_get_data_from_query"),
+        ("dataset", "_get_data_from_dataset"),
+    )
+
+    # Reader methods that are Spark data source formats rather than DataFrameReader methods.
+    _READER_DISPATCH = {
+        "delta": lambda reader: reader.format("delta").load,
+        "avro": lambda reader: reader.format("avro").load,
     }
 
     @classmethod
@@ -86,15 +168,13 @@ class SparkDFDatasource(LegacyDatasource):
         if spark_config is None:
             spark_config = {}
 
-        configuration = kwargs
-        configuration.update(
-            {
-                "data_asset_type": data_asset_type,
-                "spark_config": spark_config,
-                "force_reuse_spark_context": force_reuse_spark_context,
-                "persist": persist,
-            }
-        )
+        configuration = {
+            **kwargs,
+            "data_asset_type": data_asset_type,
+            "spark_config": spark_config,
+            "force_reuse_spark_context": force_reuse_spark_context,
+            "persist": persist,
+        }
 
         if batch_kwargs_generators:
             configuration["batch_kwargs_generators"] = batch_kwargs_generators
@@ -146,7 +226,7 @@ class SparkDFDatasource(LegacyDatasource):
 
         if spark_config is None:
             spark_config = {}
-        spark = get_or_create_spark_application(
+        spark = _get_spark_application(
             spark_config=spark_config,
             force_reuse_spark_context=force_reuse_spark_context,
         )
@@ -165,9 +245,10 @@ class SparkDFDatasource(LegacyDatasource):
         # Apply globally-configured reader options first
         if reader_options:
             # Then update with any locally-specified reader options
-            if not batch_kwargs.get("reader_options"):
-                batch_kwargs["reader_options"] = {}
-            batch_kwargs["reader_options"].update(reader_options)
+            batch_kwargs["reader_options"] = {
+                **(batch_kwargs.get("reader_options") or {}),
+                **reader_options,
+            }
 
         if reader_method is not None:
             batch_kwargs["reader_method"] = reader_method
@@ -180,52 +261,24 @@ class SparkDFDatasource(LegacyDatasource):
             logger.error("No spark session available")
             return None
 
-        reader_options = batch_kwargs.get("reader_options", {})
-
         # We need to build batch_markers to be used with the DataFrame
-        batch_markers = BatchMarkers(
-            {
-                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
-                    "%Y%m%dT%H%M%S.%fZ"
-                )
-            }
-        )
+        batch_markers = BatchMarkers(ge_load_time=_get_ge_load_time())
 
-        if "path" in batch_kwargs:
-            path = batch_kwargs["path"]
-            reader_method = batch_kwargs.get("reader_method")
-            reader = self.spark.read
-
-            for option in reader_options.items():
-                reader = reader.option(*option)
-            reader_fn = self._get_reader_fn(reader, reader_method, path)
-            df = reader_fn(path)
-
-        elif "query" in batch_kwargs:
-            df = self.spark.sql(batch_kwargs["query"])
-
-        elif "dataset" in batch_kwargs and (
+        handler_name = next(
             (
-                pyspark.DataFrame  # type: ignore[truthy-function]
-                and isinstance(batch_kwargs["dataset"], pyspark.DataFrame)
-            )
-            or isinstance(batch_kwargs["dataset"], SparkDFDataset)
-        ):
-            df = batch_kwargs.get("dataset")
-            # We don't want to store the actual dataframe in kwargs; copy the remaining batch_kwargs
-            batch_kwargs = {k: batch_kwargs[k] for k in batch_kwargs if k != "dataset"}
-            if isinstance(df, SparkDFDataset):
-                # Grab just the spark_df reference, since we want to override everything else
-                df = df.spark_df
-            # Record this in the kwargs *and* the id
-            batch_kwargs["SparkDFRef"] = True
-            batch_kwargs["ge_batch_id"] = str(uuid.uuid1())
-
-        else:
+                handler_name
+                for key, handler_name in self._BATCH_KWARGS_HANDLERS
+                if key in batch_kwargs
+            ),
+            None,
+        )
+        if handler_name is None:
             raise BatchKwargsError(
                 "Unrecognized batch_kwargs for spark_source", batch_kwargs
             )
 
+        df, batch_kwargs = getattr(self, handler_name)(batch_kwargs)
+
         if "limit" in batch_kwargs:
             df = df.limit(batch_kwargs["limit"])
 
@@ -238,15 +291,51 @@ class SparkDFDatasource(LegacyDatasource):
             data_context=self._data_context,
         )
 
+    def _get_data_from_path(self, batch_kwargs):
+        path = batch_kwargs["path"]
+        reader_method = batch_kwargs.get("reader_method")
+        reader_options = batch_kwargs.get("reader_options") or _EMPTY_OPTS
+        reader = self.spark.read
+
+        if reader_options:
+            reader = reader.options(**reader_options)
+        reader_fn = self._get_reader_fn(reader, reader_method, path)
+        return reader_fn(path), batch_kwargs
+
+    def _get_data_from_query(self, batch_kwargs):
+        return self.spark.sql(batch_kwargs["query"]), batch_kwargs
+
+    def _get_data_from_dataset(self, batch_kwargs):
+        df = batch_kwargs["dataset"]
+        if not (
+            (
+                pyspark.DataFrame  # type: ignore[truthy-function]
+                and isinstance(df, pyspark.DataFrame)
+            )
+            or isinstance(df, SparkDFDataset)
+        ):
+            raise BatchKwargsError(
+                "Unrecognized batch_kwargs for spark_source", batch_kwargs
+            )
+
+        # We don't want to store the actual dataframe in kwargs; copy the remaining batch_kwargs
+        batch_kwargs = {**batch_kwargs}
+        batch_kwargs.pop("dataset", None)
+        if isinstance(df, SparkDFDataset):
+            # Grab just the spark_df reference, since we want to override everything else
+            df = df.spark_df
+        # Record this in the kwargs *and* the id
+        batch_kwargs["SparkDFRef"] = True
+        batch_kwargs["ge_batch_id"] = str(uuid.uuid4())
+        return df, batch_kwargs
+
     @staticmethod
     def guess_reader_method_from_path(path: str):
-        path = path.lower()
-        if path.endswith(".csv") or path.endswith(".tsv"):
-            return {"reader_method": "csv"}
-        elif (
-            path.endswith(".parquet") or path.endswith(".parq") or path.endswith(".pqt")
-        ):
-            return {"reader_method": "parquet"}
+        # Match on everything from the last "." so that, as with "str.endswith", dotfile-style names resolve too.
+        _, dot, suffix = path.rpartition(".")
+        reader_method = _reader_method_from_extension(f"{dot}{suffix}".lower())
+        if reader_method is not None:
+            return {"reader_method": reader_method}
 
         raise BatchKwargsError(
             f"Unable to determine reader method from path: {path}",
@@ -277,8 +366,9 @@ class SparkDFDatasource(LegacyDatasource):
             ]
 
         try:
-            if reader_method.lower() in ["delta", "avro"]:
-                return reader.format(reader_method.lower()).load
+            reader_fn = self._READER_DISPATCH.get(reader_method.lower())
+            if reader_fn is not None:
+                return reader_fn(reader)
 
             return getattr(reader, reader_method)
         except AttributeError:
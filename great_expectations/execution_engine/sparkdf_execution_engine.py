@@ -417,11 +417,9 @@ illegal.  Please check your config."""
 
         """
         path = path.lower()
-        if path.endswith(".csv") or path.endswith(".tsv"):
+        if path.endswith((".csv", ".tsv")):
             return "csv"
-        elif (
-            path.endswith(".parquet") or path.endswith(".parq") or path.endswith(".pqt")
-        ):
+        elif path.endswith((".parquet", ".parq", ".pqt")):
             return "parquet"
 
         raise ExecutionEngineError(
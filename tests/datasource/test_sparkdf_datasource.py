@@ -10,7 +10,7 @@ from great_expectations.core.yaml_handler import YAMLHandler
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
-from great_expectations.datasource import SparkDFDatasource
+from great_expectations.datasource import SparkDFDatasource, sparkdf_datasource
 from great_expectations.exceptions import BatchKwargsError
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.validator import BridgeValidator
@@ -444,3 +444,140 @@ def test_spark_datasource_processes_dataset_options(
     dataset = validator.get_dataset()
     assert dataset.caching is False
     assert dataset._persist is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "path,expected_reader_method",
+    [
+        ("data/file.csv", "csv"),
+        ("data/file.TSV", "csv"),
+        ("data/file.parquet", "parquet"),
+        ("data/file.parq", "parquet"),
+        ("data/file.PQT", "parquet"),
+        ("data/.csv", "csv"),
+        ("data.v2/file.csv", "csv"),
+    ],
+)
+def test_guess_reader_method_from_path(path, expected_reader_method):
+    assert SparkDFDatasource.guess_reader_method_from_path(path) == {
+        "reader_method": expected_reader_method
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "path",
+    [
+        "data/file.notrecognized",
+        "data/csv",
+        "data.csv/part-0000",
+    ],
+)
+def test_guess_reader_method_from_path_unrecognized_extension(path):
+    with pytest.raises(BatchKwargsError):
+        SparkDFDatasource.guess_reader_method_from_path(path)
+
+
+@pytest.fixture
+def clear_cached_spark_application():
+    sparkdf_datasource._cached_spark_application.cache_clear()
+    yield
+    sparkdf_datasource._cached_spark_application.cache_clear()
+
+
+@pytest.mark.unit
+def test_spark_application_is_reused_for_identical_spark_config(
+    mocker, clear_cached_spark_application
+):
+    spark = mocker.MagicMock()
+    spark.sparkContext._jsc.sc().isStopped.return_value = False
+    get_or_create_spark_application = mocker.patch(
+        "great_expectations.datasource.sparkdf_datasource.get_or_create_spark_application",
+        return_value=spark,
+    )
+
+    spark_config = {"spark.app.name": "test_app"}
+    assert sparkdf_datasource._get_spark_application(spark_config, True) is spark
+    assert sparkdf_datasource._get_spark_application(dict(spark_config), True) is spark
+    get_or_create_spark_application.assert_called_once_with(
+        spark_config=spark_config, force_reuse_spark_context=True
+    )
+
+    spark.sparkContext._jsc.sc().isStopped.return_value = True
+    sparkdf_datasource._get_spark_application(spark_config, True)
+    assert get_or_create_spark_application.call_count == 2
+
+
+@pytest.mark.unit
+def test_spark_application_is_recreated_when_spark_context_stopped_from_python(
+    mocker, clear_cached_spark_application
+):
+    stopped_spark = mocker.MagicMock()
+    # PySpark sets "_jsc" to None when the SparkContext is stopped from Python.
+    stopped_spark.sparkContext._jsc = None
+    active_spark = mocker.MagicMock()
+    active_spark.sparkContext._jsc.sc().isStopped.return_value = False
+    get_or_create_spark_application = mocker.patch(
+        "great_expectations.datasource.sparkdf_datasource.get_or_create_spark_application",
+        side_effect=[stopped_spark, active_spark],
+    )
+
+    spark_config = {"spark.app.name": "test_app"}
+    assert (
+        sparkdf_datasource._get_spark_application(spark_config, False) is active_spark
+    )
+    assert get_or_create_spark_application.call_count == 2
+
+
+@pytest.fixture
+def sparkdf_datasource_with_mock_spark(mocker):
+    mocker.patch(
+        "great_expectations.datasource.sparkdf_datasource._get_spark_application",
+        return_value=mocker.MagicMock(),
+    )
+    return SparkDFDatasource("mock_spark_source", batch_kwargs_generators={})
+
+
+@pytest.mark.unit
+def test_get_batch_from_query(sparkdf_datasource_with_mock_spark):
+    datasource = sparkdf_datasource_with_mock_spark
+
+    batch = datasource.get_batch(batch_kwargs={"query": "SELECT * FROM my_table"})
+
+    datasource.spark.sql.assert_called_once_with("SELECT * FROM my_table")
+    assert batch.data is datasource.spark.sql.return_value
+    assert re.fullmatch(r"\d{8}T\d{6}\.\d{6}Z", batch.batch_markers["ge_load_time"])
+
+
+@pytest.mark.unit
+def test_get_batch_with_unrecognized_batch_kwargs(sparkdf_datasource_with_mock_spark):
+    with pytest.raises(BatchKwargsError):
+        sparkdf_datasource_with_mock_spark.get_batch(batch_kwargs={"table": "my_table"})
+
+    with pytest.raises(BatchKwargsError):
+        sparkdf_datasource_with_mock_spark.get_batch(
+            batch_kwargs={"dataset": pd.DataFrame({"a": [1, 2]})}
+        )
+
+
+@pytest.mark.unit
+def test_get_batch_from_query_applies_limit_to_dataframe(
+    sparkdf_datasource_with_mock_spark,
+):
+    datasource = sparkdf_datasource_with_mock_spark
+
+    batch = datasource.get_batch(
+        batch_kwargs={"query": "SELECT * FROM my_table -- latest", "limit": 10}
+    )
+
+    datasource.spark.sql.assert_called_once_with("SELECT * FROM my_table -- latest")
+    datasource.spark.sql.return_value.limit.assert_called_once_with(10)
+    assert batch.data is datasource.spark.sql.return_value.limit.return_value
+
+
+@pytest.mark.unit
+def test_sparkdf_datasource_instance_attributes_use_slots(
+    sparkdf_datasource_with_mock_spark,
+):
+    assert not hasattr(sparkdf_datasource_with_mock_spark, "__dict__")